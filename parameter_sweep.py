@@ -0,0 +1,32 @@
+"""(gamma, beta) のパラメータスイープを全コアで並列実行するドライバ
+
+各パラメータ設定のライフサイクル問題は互いに独立（embarrassingly parallel）
+なので、joblib.Parallel で外側のパラメータ次元をコア数分だけ並列化する。
+"""
+import numpy as np
+from joblib import Parallel, delayed
+
+from _lifecycle_core import solve_lifecycle
+
+
+def run_one(params):
+    """1つのパラメータ設定についてライフサイクル問題を解く"""
+    V_young, policy_young = solve_lifecycle(params)
+    return params, V_young, policy_young
+
+
+def main():
+    gammas = [1.5, 2.0, 3.0]
+    betas = [0.96**20, 0.985**20, 0.99**20]
+    param_grid = [dict(gamma=g, beta=b) for g in gammas for b in betas]
+
+    results = Parallel(n_jobs=-1)(delayed(run_one)(p) for p in param_grid)
+
+    print("=== パラメータスイープ結果 ===")
+    print(f"{'gamma':>6} {'beta':>8} {'平均貯蓄(若年期)':>16}")
+    for params, V_young, policy_young in results:
+        print(f"{params['gamma']:>6.2f} {params['beta']:>8.4f} {np.mean(policy_young):>16.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,41 +1,30 @@
 import numpy as np
-import matplotlib.pyplot as plt
-
-# フォント設定
-plt.rcParams['font.size'] = 10
 
 # 写真のグラフを再現するための係数（目視で調整）
-# 年金導入前の線形関係を再現
+# 政策関数はどのタイプもアフィン（傾き約0.85）なので、タイプ別の係数を
+# 配列で持てば if/elif の分岐も点ごとのループも不要になる
+slopes = np.full(3, 0.85)  # 写真から読み取った傾き
+intercepts_no_pension = np.array([0.18, 0.25, 0.33])  # 写真から読み取った切片
+# 年金制度による上方シフト（税負担が大きい高生産性ほど大きい）
+pension_shifts = np.array([0.08, 0.10, 0.12])
+intercepts_with_pension = intercepts_no_pension + pension_shifts
+
 def savings_policy_no_pension(a1, productivity_index):
     """年金制度なしの貯蓄政策関数（写真のグラフを再現）"""
-    # 写真から読み取った傾きと切片
-    if productivity_index == 0:  # Low productivity (blue line)
-        # 傾き約0.85、切片約0.18
-        return 0.85 * a1 + 0.18
-    elif productivity_index == 1:  # Medium productivity (green dashed line)  
-        # 傾き約0.85、切片約0.25
-        return 0.85 * a1 + 0.25
-    else:  # High productivity (red dash-dot line)
-        # 傾き約0.85、切片約0.33
-        return 0.85 * a1 + 0.33
+    return slopes[productivity_index] * np.asarray(a1) + intercepts_no_pension[productivity_index]
 
 def savings_policy_with_pension(a1, productivity_index):
     """年金制度ありの貯蓄政策関数（導入前より上方シフト）"""
-    # 基本的に同じ傾きだが、上方にシフト
-    base_savings = savings_policy_no_pension(a1, productivity_index)
-    
-    # 年金制度による上方シフト（生産性により差をつける）
-    if productivity_index == 0:  # Low productivity
-        shift = 0.08  # 小さめのシフト
-    elif productivity_index == 1:  # Medium productivity
-        shift = 0.10  # 中程度のシフト
-    else:  # High productivity
-        shift = 0.12  # 大きめのシフト（税負担が大きいため）
-    
-    return base_savings + shift
+    return slopes[productivity_index] * np.asarray(a1) + intercepts_with_pension[productivity_index]
 
 # グラフ作成
 def plot_savings_policies():
+    # matplotlib は描画時のみ必要（import だけの場合に初期化コストを避ける）
+    import matplotlib.pyplot as plt
+
+    # フォント設定
+    plt.rcParams['font.size'] = 10
+
     # データ範囲
     a1_values = np.linspace(0, 2.0, 100)
     
@@ -52,9 +41,10 @@ def plot_savings_policies():
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
     
     # === 年金制度なし（左側のグラフ）===
+    # 全タイプ分を一度にブロードキャストで評価：shape (3, len(a1_values))
+    savings_no_pension = slopes[:, None] * a1_values[None, :] + intercepts_no_pension[:, None]
     for i in range(3):
-        savings_no_pension = [savings_policy_no_pension(a1, i) for a1 in a1_values]
-        ax1.plot(a1_values, savings_no_pension, 
+        ax1.plot(a1_values, savings_no_pension[i], 
                 color=colors[i], linestyle=linestyles[i], linewidth=2.5,
                 label=productivity_labels[i])
     
@@ -70,9 +60,9 @@ def plot_savings_policies():
     ax1.set_ylim(0, 2)
     
     # === 年金制度あり（右側のグラフ）===
+    savings_with_pension = slopes[:, None] * a1_values[None, :] + intercepts_with_pension[:, None]
     for i in range(3):
-        savings_with_pension = [savings_policy_with_pension(a1, i) for a1 in a1_values]
-        ax2.plot(a1_values, savings_with_pension, 
+        ax2.plot(a1_values, savings_with_pension[i], 
                 color=colors[i], linestyle=linestyles[i], linewidth=2.5,
                 label=productivity_labels[i])
     
@@ -141,14 +131,11 @@ def detailed_graph_analysis():
     print("\n=== グラフの特徴分析 ===")
     
     # 傾きの確認
-    slope = 0.85
+    slope = slopes[0]
     print(f"貯蓄政策関数の傾き: {slope}")
     print("→ 限界貯蓄性向が85%（1を下回るため安定性を示す）")
     
     # 切片の確認
-    intercepts_no_pension = [0.18, 0.25, 0.33]
-    intercepts_with_pension = [0.26, 0.35, 0.45]
-    
     print("\n切片の比較:")
     productivity_names = ['低生産性', '中生産性', '高生産性']
     for i in range(3):